@@ -0,0 +1,355 @@
+"""Implementation of the command line interface.
+
+`memic.cli.cli` is the thin dispatch shell; everything it does not need for its
+fast paths (the command enums, the `Scripts` class and the help generators)
+lives here and is only imported once a real command has to run.
+"""
+import functools
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from memic.cli import cli as _cli
+
+# ANSI escape codes used by the help formatters, built once
+_ANSI_END = "\033[0m"
+_ANSI_BOLD = "\033[1m"
+_ANSI_BLUE = "\033[34m"
+
+# per-command help rows with the ANSI codes substituted once at import
+_CMD_ROW_TMPL = f"\t`memic {_ANSI_BOLD}{_ANSI_BLUE}{{name}}{_ANSI_END}` => `{{cmd}}`\n"
+_SCRIPT_ROW_TMPL = f"\t`memic {_ANSI_BOLD}{_ANSI_BLUE}{{name}}{_ANSI_END}`: {{doc}}\n"
+
+
+@functools.lru_cache(maxsize=None)
+def _which(prog):
+    """Resolve (and cache) an executable on PATH, falling back to the bare name."""
+    import shutil
+
+    return shutil.which(prog) or prog
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logger():
+    """Configure (once, on first log) and return the module logger.
+
+    Deferred so importing this module never installs a stream handler into the host's logging config.
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    return logger
+
+
+# lazily-built enum classes — the BetterEnum metaclass only runs when a command
+# actually needs to dispatch through them, not on every import
+_cmds = None
+_internal_cmds = None
+
+# aliases that are the user's intended final process — exec'd in place of this
+# interpreter rather than kept waiting on a child
+_EXEC_LEAVES = {"jup", "console", "repl"}
+
+
+def _get_cmds():
+    """Build (once) and return the `Cmds` enum class."""
+    global _cmds
+    if _cmds is not None:
+        return _cmds
+
+    from memic.utility.better_enum import BetterEnum
+
+    class Cmds(BetterEnum):
+        """A collection of commands to be run in the terminal."""
+
+        # jupyter tools
+        jup = [
+            "jupyter",
+            "notebook",
+            "--ip=0.0.0.0",
+            "--allow-root",
+            "--notebook-dir=src/jupyter",
+            "--NotebookApp.token=",
+            "--NotebookApp.password=",
+        ]
+
+        console = ["ipython", "-i", "-c"]
+        repl = ["python", "-i", "-c"]
+
+        @classmethod
+        def get_help(cls):
+            return _cmds_help()
+
+        @classmethod
+        def help(cls):
+            print(cls.get_help())
+
+    _cmds = Cmds
+    return _cmds
+
+
+@functools.lru_cache(maxsize=1)
+def _cmds_dict():
+    """Build (once) a name -> argv mapping for the command aliases."""
+    return dict(_get_cmds().items())
+
+
+@functools.lru_cache(maxsize=1)
+def _cmds_help():
+    """Build (once) the help string listing the direct command aliases."""
+    parts = ["Direct Command Aliases:\n"]
+    parts.extend(_CMD_ROW_TMPL.format(name=name, cmd=" ".join(cmd)) for name, cmd in _get_cmds().items())
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _open_browser():
+    """Return (once) the platform's open-a-URL command."""
+    if sys.platform.startswith("linux"):
+        return ["xdg-open"]
+    if sys.platform == "darwin":
+        return ["open"]
+    return ["explorer"]
+
+
+def _get_internal_cmds():
+    """Build (once) and return the `InternalCmds` enum class."""
+    global _internal_cmds
+    if _internal_cmds is not None:
+        return _internal_cmds
+
+    from memic.utility.better_enum import BetterEnum
+
+    class InternalCmds(BetterEnum):
+        """A collection of commands to be run in the terminal.
+
+        These commands can be used by the Scripts class or directly by the command line tool.
+        """
+
+        # general tools
+        open_browser = _open_browser()
+
+        # git tools
+        pre_commit_run_all_files = ["pre-commit", "run", "--all-files"]
+        black_reformat = ["pre-commit", "run", "black", "--all-files", "--hook-stage", "manual"]
+        git_update = ["git", "add", "-u"]
+        """-u, or --update: This option makes git add look not at the working directory,
+        but at the difference between the index (staged changes) and the current HEAD commit.
+        It stages the changes to any tracked files, ready for the next commit.
+        It does not add any new files, it only stages changes to already tracked files."""
+
+        # pytest tools
+        pytest = ["pytest"]
+        pytest_cov = pytest + ["--cov"]
+        coverage_html = ["coverage", "html"]
+        open_coverage = open_browser + [f"file://{Path('htmlcov/index.html').resolve()}"]
+
+    _internal_cmds = InternalCmds
+    return _internal_cmds
+
+
+def __getattr__(name):
+    """Keep the lazily-built public names working for external callers (PEP 562)."""
+    if name == "Cmds":
+        return _get_cmds()
+    if name == "InternalCmds":
+        return _get_internal_cmds()
+    if name == "scripts":
+        return _get_scripts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyDocMeta(type):
+    """Metaclass that serves the full command-line help as the class docstring.
+
+    A data descriptor on the metaclass wins over the class-body docstring, so
+    `help(Scripts)` shows the generated (and cached) help without the module
+    ever paying for it at import time.
+    """
+
+    @property
+    def __doc__(cls):
+        return _scripts_help()
+
+
+class Scripts(metaclass=_LazyDocMeta):
+    """A collection of scripts to be run in the terminal."""
+
+    def __init__(self):
+        # O(1) command dispatch without per-call hasattr/getattr MRO walks
+        self._dispatch = {name: getattr(self, name) for name in Scripts._PUBLIC}
+
+    def fix(self):
+        """Fix common issues by calling `pre-commit run --all-files`."""
+        cmd = list(_get_internal_cmds().pre_commit_run_all_files)
+        # the only action — exec pre-commit in place rather than fork and wait on it
+        os.execvp(_which(cmd[0]), cmd)
+
+    def fmt(self, *args):
+        """Format code using `black`."""
+        internal_cmds = _get_internal_cmds()
+        subprocess.run(internal_cmds.black_reformat)
+        subprocess.run(internal_cmds.git_update)
+
+    def test(self, *args):
+        """Run tests and open coverage report."""
+        internal_cmds = _get_internal_cmds()
+        p = subprocess.run(list(internal_cmds.pytest_cov))
+
+        if p.returncode == 0:
+            if "--no-open" in args:
+                return
+            subprocess.run(internal_cmds.coverage_html)
+            # final step needs no return value — exec the browser opener in place
+            open_coverage = list(internal_cmds.open_coverage)
+            os.execvp(_which(open_coverage[0]), open_coverage)
+
+    def toolbox(self, *args):
+        """Run the demo toolbox UI."""
+        self._run_handler("toolbox", *args)
+
+    def cli(self, *args):
+        """The main command line interface from CorentinJ/Real-Time-Voice-Cloning."""
+        self._run_handler("cli", *args)
+
+    def enc(self, *args):
+        """Alias for `encoder`."""
+        self.encoder(*args)
+
+    def encoder(self, cmd, *args):
+        """Run a command from the encoder cli (`encoder train` or `encoder preprocess`)."""
+        self._run_handler("encoder", cmd, *args)
+
+    def synth(self, *args):
+        """Alias for `synthesizer`."""
+        self.synthesizer(*args)
+
+    def synthesizer(self, cmd, *args):
+        """Run a command from the synthesizer cli (`synthesizer train` or `synthesizer preprocess`)."""
+        self._run_handler("synthesizer", cmd, *args)
+
+    def voc(self, *args):
+        """Alias for `vocoder`."""
+        self.vocoder(*args)
+
+    def vocode(self, *args):
+        """Alias for `vocoder`."""
+        self.vocoder(*args)
+
+    def vocoder(self, cmd, *args):
+        """Run a command from the vocoder cli (`vocoder train` or `vocoder preprocess`)."""
+        self._run_handler("vocoder", cmd, *args)
+
+    def _run_handler(self, *argv):
+        """Import on demand and run the handler module selected by the argv prefix in `_LEAF`."""
+        handler, args = _cli._sniff_leaf(list(argv))
+        if handler is not None:
+            handler(*args)
+
+    def _run(self, cmd, *args):
+        """Run a command either from a method in this class or from a command in Cmds class."""
+        # match on string literals compiles to a single jump-table lookup
+        match cmd:
+            case "-v" | "--version":
+                _cli._print_version()
+            case "-vv" | "--version-full":
+                _cli._print_version_full()
+            case "help":
+                self.help(*args)
+            case _:
+                fn = self._dispatch.get(cmd)
+                if fn is not None:
+                    fn(*args)
+                    return
+                cmd_list = _cmds_dict().get(cmd)
+                if cmd_list is None:
+                    self.help(*args)
+                    return
+                cmd_list = list(cmd_list)
+                _get_logger().info("Running command: %s", cmd_list)
+                if cmd in _EXEC_LEAVES:
+                    # replaces the current process — no code after this runs
+                    os.execvp(cmd_list[0], cmd_list)
+                subprocess.run(cmd_list)
+
+    def __call__(self, cmd, *args):
+        self._run(cmd, *args)
+
+    @classmethod
+    def get_help(cls, func=None, *args):
+        """Print command line help."""
+        if func is not None and func.startswith("--"):
+            func = None
+        if func is not None and not hasattr(cls, func) and not hasattr(_get_cmds(), func):
+            return help(func)
+        return _scripts_help(func)
+
+    def help(self, *args):
+        """Print command line help.
+
+        No args:
+            print a list of available commands, e.g. `memic help`
+        command_name:
+            print help for a specific command, e.g. `memic help help`
+        other:
+            print Python help documentation for a python object, e.g. `memic help int`
+
+        """
+        print(self.get_help(*args))
+
+
+# public command names, computed once at class creation — avoids a full dir()
+# scan (which includes inherited attributes) on every help build and dispatch
+Scripts._PUBLIC = tuple(
+    sorted(name for name, value in vars(Scripts).items() if not name.startswith("_") and name != "get_help" and callable(value))
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _memic_bin_path():
+    """Resolve (once) the path of the installed `memic` executable."""
+    return Path(sys.executable).parent.joinpath("memic").resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _scripts_help(func=None):
+    """Build (once per `func`) the help string for `Scripts`."""
+    if func is not None:
+        if hasattr(Scripts, func):
+            return getattr(Scripts, func).__doc__
+        cmd = " ".join(getattr(_get_cmds(), func))
+        return f"`{_ANSI_BOLD}memic {func}{_ANSI_END}` calls `{cmd}`"
+
+    parts = [
+        "The `memic` command line tool...\n",
+        "\t* is installed into the virtual environment by pip due to pyproject.toml config\n",
+        f"\t* lives at {_memic_bin_path()}\n",
+        f"\t* calls {_cli.__file__}:main() with the arguments you pass to it\n\n",
+        "Available commands: (call `memic help <command>` for more info)\n",
+        f"\t`{_ANSI_BOLD}{_ANSI_BLUE}memic{_ANSI_END}`: print help\n",
+        _SCRIPT_ROW_TMPL.format(name="-v", doc="print the version (`--version-full` adds the git summary)"),
+    ]
+
+    for name in Scripts._PUBLIC:
+        d = getattr(Scripts, name).__doc__
+        d = d.partition("\n")[0] if isinstance(d, str) else ""
+        parts.append(_SCRIPT_ROW_TMPL.format(name=name, doc=d))
+
+    parts.append("\n")
+    parts.append(_get_cmds().get_help())
+    parts.append("\n")
+    parts.append("Misc help: (python built-in help() gets called on any unrecognized arguments (Press `q` to exit))\n")
+    return "".join(parts)
+
+
+_scripts = None
+
+
+def _get_scripts():
+    """Build (once) and return the shared `Scripts` instance."""
+    global _scripts
+    if _scripts is None:
+        _scripts = Scripts()
+    return _scripts
@@ -1,254 +1,119 @@
 """A command line interface for the repository.
+
+This module is deliberately thin: `main` handles the version/help/leaf-handler
+fast paths with nothing but the standard library, and only falls back to the
+full `Scripts` machinery in `memic.cli._impl` for everything else.
 """
-import logging
 import os
-import subprocess
 import sys
 from pathlib import Path
 
-from memic.utility.better_enum import BetterEnum
+_root = None
 
-# use outermost directory as root
-os.chdir(Path(__file__).parent.parent.parent)
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.addHandler(logging.StreamHandler(sys.stdout))
+def _ensure_cwd():
+    """Chdir (once) to the outermost directory so commands run from the repo root.
 
+    Kept out of module scope so merely importing this module has no side effect.
+    """
+    global _root
+    if _root is None:
+        _root = Path(__file__).resolve().parents[2]
+        os.chdir(_root)
+
+
+# leaf subcommands whose handler module can be imported directly, keyed by the
+# argv words that select them — lets `main` skip `Scripts` dispatch entirely
+_LEAF = {
+    ("toolbox",): "memic.cli.demo_toolbox",
+    ("cli",): "memic.cli.demo_cli",
+    ("encoder", "train"): "memic.cli.encoder_train",
+    ("encoder", "preprocess"): "memic.cli.encoder_preprocess",
+    ("synthesizer", "train"): "memic.cli.synthesizer_train",
+    ("synthesizer", "preprocess", "audio"): "memic.cli.synthesizer_preprocess_audio",
+    ("synthesizer", "preprocess", "embeds"): "memic.cli.synthesizer_preprocess_embeds",
+    ("vocoder", "train"): "memic.cli.vocoder_train",
+    ("vocoder", "preprocess"): "memic.cli.vocoder_preprocess",
+}
+
+
+def _sniff_leaf(argv):
+    """Return `(handler_main, remaining_args)` when argv selects a known leaf subcommand."""
+    import importlib
+
+    for n in (3, 2, 1):
+        mod = _LEAF.get(tuple(argv[:n]))
+        if mod is not None:
+            return importlib.import_module(mod).main, argv[n:]
+    return None, argv
+
+
+def _print_version():
+    """Print just the package version.
+
+    The import is kept inside the function so the version fast path in `main` stays cheap,
+    and the git summary (several subprocess spawns) is reserved for `--version-full`.
+    """
+    import cutwater
 
-class Cmds(BetterEnum):
-    """A collection of commands to be run in the terminal."""
+    print(f"Version: {cutwater.__version__}")
 
-    # jupyter tools
-    jup = [
-        "jupyter",
-        "notebook",
-        "--ip=0.0.0.0",
-        "--allow-root",
-        "--notebook-dir='src/jupyter'",
-        "--NotebookApp.token=''",
-        "--NotebookApp.password=''",
-    ]
 
-    console = ["ipython", "-i", "-c"]
-    repl = ["python", "-i", "-c"]
+def _print_version_full():
+    """Print the package version and a summary of the git state."""
+    _print_version()
+    from memic.utility.version_control import VersionControl
 
-    @classmethod
-    def get_help(cls):
-        s = "Direct Command Aliases:\n"
-        end = "\033[0m"
-        bold = "\033[1m"
-        blue = "\033[34m"
-        for name, cmd in cls.items():
-            c = " ".join(cmd)
-            s += f"\t`memic {bold}{blue}{name}{end}` => `{c}`\n"
-        return s
+    vc = VersionControl()
+    gs = vc.summary  # computed on a background thread since construction
+    print(f"Git Remote: {gs['remote']}")
+    print(f"Git Branch: {gs['branch']}")
+    print(f"Git Tag: {gs['tag']}")
+    print(f"Git Commit Date: {gs['date']}")
 
-    @classmethod
-    def help(cls):
-        print(cls.get_help())
 
+def _load_scripts():
+    """Import the implementation module and return the shared `Scripts` instance."""
+    from memic.cli._impl import _get_scripts
 
-Cmds.__doc__ = Cmds.get_help()
+    return _get_scripts()
 
 
-class InternalCmds(BetterEnum):
-    """A collection of commands to be run in the terminal.
+def __getattr__(name):
+    """Re-export the public implementation names without importing `_impl` eagerly (PEP 562)."""
+    if name in ("Cmds", "InternalCmds", "Scripts", "scripts"):
+        from memic.cli import _impl
+
+        return getattr(_impl, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    These commands can be used by the Scripts class or directly by the command line tool.
-    """
 
-    # general tools
-    open_browser = ["xdg-open" if sys.platform.startswith("linux") else "explorer"]
-
-    # git tools
-    pre_commit_run_all_files = ["pre-commit", "run", "--all-files"]
-    black_reformat = ["pre-commit", "run", "black", "--all-files", "--hook-stage", "manual"]
-    git_update = ["git", "add", "-u"]
-    """-u, or --update: This option makes git add look not at the working directory,
-    but at the difference between the index (staged changes) and the current HEAD commit.
-    It stages the changes to any tracked files, ready for the next commit.
-    It does not add any new files, it only stages changes to already tracked files."""
-
-    # pytest tools
-    pytest = ["pytest"]
-    pytest_cov = pytest + ["--cov"]
-    coverage_html = ["coverage", "html"]
-    open_coverage = open_browser + [f"file://{Path('htmlcov/index.html').resolve()}"]
-
-
-class Scripts:
-    """A collection of scripts to be run in the terminal."""
-
-    def fix(self):
-        """Fix common issues by calling `pre-commit run --all-files`."""
-        subprocess.run(InternalCmds.pre_commit_run_all_files)
-
-    def fmt(self, *args):
-        """Format code using `black`."""
-        subprocess.run(InternalCmds.black_reformat)
-        subprocess.run(InternalCmds.git_update)
-
-    def test(self, *args):
-        """Run tests and open coverage report."""
-        p = subprocess.run(" ".join(InternalCmds.pytest_cov), shell=True)
-
-        if p.returncode == 0:
-            if "--no-open" in args:
-                return
-            subprocess.run(InternalCmds.coverage_html)
-            subprocess.run(InternalCmds.open_coverage)
-
-    def toolbox(self, *args):
-        """Run the demo toolbox UI."""
-        from memic.cli.demo_toolbox import main
-
-        main(*args)
-
-    def cli(self, *args):
-        """The main command line interface from CorentinJ/Real-Time-Voice-Cloning."""
-        from memic.cli.demo_cli import main
-
-        main(*args)
-
-    def enc(self, *args):
-        """Alias for `encoder`."""
-        self.encoder(*args)
-
-    def encoder(self, cmd, *args):
-        """Run a command from the encoder cli (`encoder train` or `encoder preprocess`)."""
-        if cmd == "train":
-            from memic.cli.encoder_train import main
-            main(*args)
-        elif cmd == "preprocess":
-            from memic.cli.encoder_preprocess import main
-            main(*args)
-
-    def synth(self, *args):
-        """Alias for `synthesizer`."""
-        self.synthesizer(*args)
-
-    def synthesizer(self, cmd, *args):
-        """Run a command from the synthesizer cli (`synthesizer train` or `synthesizer preprocess`)."""
-        if cmd == "preprocess":
-            self._synthesizer_preprocess(*args)
-        elif cmd == "train":
-            from memic.cli.synthesizer_train import main
-            main(*args)
-
-    def _synthesizer_preprocess(self, cmd, *args):
-        if cmd == "audio":
-            from memic.cli.synthesizer_preprocess_audio import main
-            main(*args)
-        elif cmd == "embeds":
-            from memic.cli.synthesizer_preprocess_embeds import main
-            main(*args)
-
-    def voc(self, *args):
-        """Alias for `vocoder`."""
-        self.vocoder(*args)
-
-    def vocode(self, *args):
-        """Alias for `vocoder`."""
-        self.vocoder(*args)
-
-    def vocoder(self, cmd, *args):
-        """Run a command from the vocoder cli (`vocoder train` or `vocoder preprocess`)."""
-        if cmd == "train":
-            from memic.cli.vocoder_train import main
-            main(*args)
-        elif cmd == "preprocess":
-            from memic.cli.vocoder_preprocess import main
-            main(*args)
-
-    def _run(self, cmd, *args):
-        """Run a command either from a method in this class or from a command in Cmds class."""
-        if hasattr(self, cmd):
-            getattr(self, cmd)(*args)
-        elif hasattr(Cmds, cmd):
-            logger.info(f"Running command: {getattr(Cmds, cmd)}")
-            subprocess.run(" ".join(getattr(Cmds, cmd)), shell=True)
-        elif cmd in ["-v", "--version"]:
-            import cutwater
-
-            print(f"Version: {cutwater.__version__}")
-            from memic.utility.version_control import VersionControl
-
-            vc = VersionControl()
-            gs = vc.git_summary()
-            print(f"Git Remote: {gs['remote']}")
-            print(f"Git Branch: {gs['branch']}")
-            print(f"Git Tag: {gs['tag']}")
-            print(f"Git Commit Date: {gs['date']}")
-        else:
-            self.help(*args)
-
-    def __call__(self, cmd, *args):
-        self._run(cmd, *args)
-
-    @classmethod
-    def get_help(cls, func=None, *args):
-        """Print command line help."""
-        if func is not None and func.startswith("--"):
-            func = None
-        x = Path(sys.executable).parent / "memic"
-        s = "The `memic` command line tool...\n"
-        s += "\t* is installed into the virtual environment by pip due to pyproject.toml config\n"
-        s += f"\t* lives at {x.resolve()}\n"
-        s += f"\t* calls {__file__}:main() with the arguments you pass to it\n\n"
-
-        end = "\033[0m"
-        bold = "\033[1m"
-        blue = "\033[34m"
-        if func is not None:
-            if hasattr(cls, func):
-                func = getattr(cls, func)
-                return func.__doc__
-            elif hasattr(Cmds, func):
-                cmd = " ".join(getattr(Cmds, func))
-                return f"`{bold}memic {func}{end}` calls `{cmd}`"
-            else:
-                return help(func)
-
-        s += "Available commands: (call `memic help <command>` for more info)\n"
-        s += f"\t`{bold}{blue}memic{end}`: print help\n"
-
-        for name in dir(cls):
-            if name.startswith("_") or name == "get_help":
-                continue
-            func = getattr(cls, name)
-            d = func.__doc__
-            d = d.splitlines()[0] if isinstance(d, str) else ""
-            s += f"\t`memic {bold}{blue}{name}{end}`: {d}\n"
-
-        s += "\n"
-        s += Cmds.get_help()
-        s += "\n"
-        s += "Misc help: (python built-in help() gets called on any unrecognized arguments (Press `q` to exit))\n"
-        return s
-
-    def help(self, *args):
-        """Print command line help.
-
-        No args:
-            print a list of available commands, e.g. `memic help`
-        command_name:
-            print help for a specific command, e.g. `memic help help`
-        other:
-            print Python help documentation for a python object, e.g. `memic help int`
-
-        """
-        print(self.get_help(*args))
-
-
-Scripts.__doc__ = Scripts.get_help()
-scripts = Scripts()
+__all__ = ["Cmds", "InternalCmds", "Scripts", "main", "scripts"]
 
 
 def main():
-    if len(sys.argv) == 1:
-        sys.argv.append("help")
-    scripts(*sys.argv[1:])
+    # fast path: answer `memic -v` without touching the command classes at all
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        _print_version()
+        return
+    if len(sys.argv) == 2 and sys.argv[1] in ("-vv", "--version-full"):
+        _print_version_full()
+        return
+    # fast path: the zero-arg/help discovery case never needs a Scripts instance
+    # (or a chdir) — emit the cached help string in a single write
+    if len(sys.argv) <= 1 or (len(sys.argv) == 2 and sys.argv[1] == "help"):
+        from memic.cli._impl import _scripts_help
+
+        sys.stdout.write(_scripts_help() + "\n")
+        return
+    # fast path: jump straight to the one handler module the user asked for
+    handler, args = _sniff_leaf(sys.argv[1:])
+    if handler is not None:
+        _ensure_cwd()
+        handler(*args)
+        return
+    _ensure_cwd()
+    _load_scripts()(*sys.argv[1:])
 
 
 if __name__ == "__main__":
@@ -1,22 +1,30 @@
+import json
+import os
 import re
 import sys
+import threading
 from pathlib import Path
-from time import sleep
+from random import randrange
+from time import monotonic
 from warnings import filterwarnings, warn
 
+import lazy_loader as lazy
 import matplotlib.pyplot as plt
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
-import umap
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from memic.encoder.inference import plot_embedding_as_heatmap
 from memic.toolbox.utterance import Utterance
-from PyQt5.QtCore import QStringListModel, Qt
+from PyQt5.QtCore import QObject, QRunnable, QStringListModel, Qt, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import *  # noqa: F403
 
 filterwarnings("ignore")
 
+# deferred until first attribute access: umap drags in numba/LLVM JIT warmup and
+# sounddevice initializes PortAudio, neither of which should delay the window
+# (numpy/matplotlib stay eager — everything here depends on them immediately)
+sd = lazy.load("sounddevice")
+sf = lazy.load("soundfile")
+umap = lazy.load("umap")
+
 
 colormap = (
     np.array(
@@ -36,9 +44,10 @@ colormap = (
             [183, 183, 183],
             [76, 255, 0],
         ],
-        dtype=np.float64,
+        dtype=np.float32,
     )
-    / 255
+    # multiply by the precomputed reciprocal — float32 is all matplotlib needs
+    * (1.0 / 255.0)
 )
 
 default_text = """Welcome to the toolbox! To begin, load an utterance from your datasets or record one
@@ -52,10 +61,34 @@ Synthesized utterances are of the same color as the speaker whose voice was used
 """
 
 
+class _ProjectionWorker(QRunnable):
+    """Compute utterance projections on a thread-pool thread so the UI stays responsive."""
+
+    class Signals(QObject):
+        finished = pyqtSignal(int, list, object)
+
+    def __init__(self, generation, project, utterances):
+        super().__init__()
+        self.generation = generation
+        self.project = project
+        self.utterances = utterances
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            projections = self.project(self.utterances)
+        except Exception as e:
+            print(e)
+            projections = None
+        self.signals.finished.emit(self.generation, self.utterances, projections)
+
+
 class UI(QDialog):
     min_umap_points = 4
     max_log_lines = 5
     max_saved_utterances = 20
+    # project with PCA (small sets) / landmark UMAP (large sets) instead of a full UMAP fit
+    use_fast_projection = True
 
     def draw_utterance(self, utterance: Utterance, which):
         self.draw_spec(utterance.spec, which)
@@ -66,45 +99,73 @@ class UI(QDialog):
         embed_ax.figure.suptitle("" if embed is None else name)
 
         ## Embedding
-        # Clear the plot
-        if len(embed_ax.images) > 0:
-            embed_ax.images[0].colorbar.remove()
-        embed_ax.clear()
-
-        # Draw the embed
-        if embed is not None:
-            plot_embedding_as_heatmap(embed, embed_ax)
-            embed_ax.set_title("embedding")
+        im = self._embed_ims.get(which)
+        if embed is None:
+            # Clear the plot
+            if im is not None:
+                self._embed_cbars[which].remove()
+                self._embed_ims[which] = self._embed_cbars[which] = None
+            embed_ax.clear()
+        else:
+            # same square reshape as plot_embedding_as_heatmap
+            height = int(np.sqrt(len(embed)))
+            embed = embed.reshape((height, -1))
+            if im is not None and im.get_array().shape != embed.shape:
+                self._embed_cbars[which].remove()
+                embed_ax.clear()
+                im = self._embed_ims[which] = None
+            if im is None:
+                # first draw (or new shape): create the image and colorbar once, reuse after
+                im = self._embed_ims[which] = embed_ax.imshow(embed)
+                self._embed_cbars[which] = embed_ax.figure.colorbar(im, ax=embed_ax, fraction=0.046, pad=0.04)
+                embed_ax.set_title("embedding")
+            else:
+                # repeat draw: update the cached artists instead of tearing down the colorbar
+                im.set_data(embed)
+                im.set_clim(embed.min(), embed.max())
+                self._embed_cbars[which].update_normal(im)
         embed_ax.set_aspect("equal", "datalim")
         embed_ax.set_xticks([])
         embed_ax.set_yticks([])
-        embed_ax.figure.canvas.draw()
+        embed_ax.figure.canvas.draw_idle()
 
     def draw_spec(self, spec, which):
         _, spec_ax = self.current_ax if which == "current" else self.gen_ax
 
         ## Spectrogram
         # Draw the spectrogram
-        spec_ax.clear()
-        if spec is not None:
-            spec_ax.imshow(spec, aspect="auto", interpolation="none")
+        im = self._spec_ims.get(which)
+        if spec is None:
+            spec_ax.clear()
+            self._spec_ims[which] = None
+            spec_ax.set_xticks([])
+            spec_ax.set_yticks([])
+            spec_ax.figure.canvas.draw_idle()
+        elif im is None:
+            spec_ax.clear()
+            self._spec_ims[which] = spec_ax.imshow(spec, aspect="auto", interpolation="none")
             spec_ax.set_title("mel spectrogram")
-
-        spec_ax.set_xticks([])
-        spec_ax.set_yticks([])
-        spec_ax.figure.canvas.draw()
+            spec_ax.set_xticks([])
+            spec_ax.set_yticks([])
+            spec_ax.figure.canvas.draw_idle()
+        else:
+            # update the cached artist in place and blit — much cheaper than clear()+imshow()+draw()
+            im.set_data(spec)
+            im.set_extent((-0.5, spec.shape[1] - 0.5, spec.shape[0] - 0.5, -0.5))
+            im.set_clim(spec.min(), spec.max())
+            spec_ax.draw_artist(im)
+            spec_ax.figure.canvas.blit(spec_ax.bbox)
+            spec_ax.figure.canvas.flush_events()
         if which != "current":
             self.vocode_button.setDisabled(spec is None)
 
     def draw_umap_projections(self, utterances: set[Utterance]):
-        self.umap_ax.clear()
-
-        speakers = np.unique([u.speaker_name for u in utterances])
-        colors = {speaker_name: colormap[i] for i, speaker_name in enumerate(speakers)}
-        embeds = [u.embed for u in utterances]
+        # any in-flight worker result is now stale
+        self._umap_gen += 1
 
         # Display a message if there aren't enough points
         if len(utterances) < self.min_umap_points:
+            self.umap_ax.clear()
             self.umap_ax.text(
                 0.5,
                 0.5,
@@ -113,30 +174,120 @@ class UI(QDialog):
                 fontsize=15,
             )
             self.umap_ax.set_title("")
-
-        # Compute the projections
+            self._finish_umap_draw()
+            return
+
+        if not self.umap_hot:
+            self.log("Drawing UMAP projections for the first time, this will take a few seconds.")
+            self.umap_hot = True
+
+        # Compute the projections off the Qt main thread; _on_projections draws them
+        canvas = self.umap_ax.figure.canvas
+        if self._umap_bg is not None:
+            # blit the placeholder over the cached pixel background instead of a full re-render
+            canvas.restore_region(self._umap_bg)
+            txt = self.umap_ax.text(
+                0.5, 0.5, "Computing projections...", horizontalalignment="center", fontsize=15, transform=self.umap_ax.transAxes
+            )
+            self.umap_ax.draw_artist(txt)
+            canvas.blit(self.umap_ax.bbox)
+            txt.remove()
         else:
-            if not self.umap_hot:
-                self.log("Drawing UMAP projections for the first time, this will take a few seconds.")
-                self.umap_hot = True
-
-            reducer = umap.UMAP(int(np.ceil(np.sqrt(len(embeds)))), metric="cosine")
-            projections = reducer.fit_transform(embeds)
-
-            speakers_done = set()
-            for projection, utterance in zip(projections, utterances):
-                color = colors[utterance.speaker_name]
-                mark = "x" if "_gen_" in utterance.name else "o"
-                label = None if utterance.speaker_name in speakers_done else utterance.speaker_name
-                speakers_done.add(utterance.speaker_name)
-                self.umap_ax.scatter(projection[0], projection[1], c=[color], marker=mark, label=label)
-            self.umap_ax.legend(prop={"size": 10})
-
-        # Draw the plot
+            self.umap_ax.clear()
+            self.umap_ax.text(0.5, 0.5, "Computing projections...", horizontalalignment="center", fontsize=15)
+            self.umap_ax.set_title("")
+            self._finish_umap_draw()
+        worker = _ProjectionWorker(self._umap_gen, self._umap_project, list(utterances))
+        worker.signals.finished.connect(self._on_projections)
+        self._umap_pool.start(worker)
+
+    def _on_projections(self, generation, utterances, projections):
+        # a newer request superseded this one (or the fit failed) — drop the result
+        if generation != self._umap_gen or projections is None:
+            return
+        self.umap_ax.clear()
+
+        # O(N) and insertion-ordered, unlike np.unique's sort over object strings
+        speakers = list(dict.fromkeys(u.speaker_name for u in utterances))
+        colors = {speaker_name: colormap[i] for i, speaker_name in enumerate(speakers)}
+
+        # one PathCollection per marker type instead of one scatter artist per utterance
+        projections = np.asarray(projections)
+        is_gen = np.array(["_gen_" in u.name for u in utterances])
+        cols = np.array([colors[u.speaker_name] for u in utterances])
+        if (~is_gen).any():
+            self.umap_ax.scatter(projections[~is_gen, 0], projections[~is_gen, 1], c=cols[~is_gen], marker="o")
+        if is_gen.any():
+            self.umap_ax.scatter(projections[is_gen, 0], projections[is_gen, 1], c=cols[is_gen], marker="x")
+        # proxy artists keep one legend entry per speaker regardless of point count
+        handles = [plt.Line2D([], [], marker="o", linestyle="", color=colors[s], label=s) for s in speakers]
+        self.umap_ax.legend(handles=handles, prop={"size": 10})
+        self._finish_umap_draw()
+
+    def _finish_umap_draw(self):
         self.umap_ax.set_aspect("equal", "datalim")
         self.umap_ax.set_xticks([])
         self.umap_ax.set_yticks([])
-        self.umap_ax.figure.canvas.draw()
+        canvas = self.umap_ax.figure.canvas
+        canvas.draw()
+        # cache the freshly-rendered pixels so transient overlays can blit over them
+        self._umap_bg = canvas.copy_from_bbox(self.umap_ax.bbox)
+
+    def resizeEvent(self, event):
+        # the cached pixel background no longer matches the canvas size
+        self._umap_bg = None
+        super().resizeEvent(event)
+
+    def _umap_project(self, utterances: list):
+        """Project the utterance embeds to 2D, reusing the fitted reducer where possible.
+
+        A full UMAP fit takes seconds; for the common "one utterance was added" case the
+        cached reducer only has to transform the new embeds. A refit happens when there is
+        no reducer yet, when utterances were removed, or when the set grew by more than 25%
+        since the last fit (at which point the fitted neighbor graph is too stale).
+        """
+        cache = self._umap_cache
+        names = frozenset(u.name for u in utterances)
+        fitted = cache["sig"]
+        added = names - fitted if fitted else names
+        refit = cache["reducer"] is None or not fitted <= names or len(added) > max(1, len(fitted) // 4)
+
+        if refit:
+            embeds = np.asarray([u.embed for u in utterances], dtype=np.float32)
+            if self.use_fast_projection and len(embeds) < 50:
+                # speaker-embed clusters are already well separated in cosine space, so a
+                # normalized randomized PCA looks very similar at ~100x lower cost
+                from sklearn.decomposition import PCA
+                from sklearn.preprocessing import normalize
+
+                reducer = PCA(n_components=2, svd_solver="randomized")
+                projections = reducer.fit_transform(normalize(embeds))
+                cache["normalize"] = True
+            elif self.use_fast_projection:
+                # FastUMAP-style: fit on sqrt(n) landmarks only, then project everything
+                m = int(np.ceil(np.sqrt(len(embeds))))
+                reducer = umap.UMAP(max(2, int(np.ceil(np.sqrt(m)))), metric="cosine")
+                reducer.fit(embeds[np.random.choice(len(embeds), m, replace=False)])
+                projections = reducer.transform(embeds)
+                cache["normalize"] = False
+            else:
+                reducer = umap.UMAP(int(np.ceil(np.sqrt(len(embeds)))), metric="cosine")
+                projections = reducer.fit_transform(embeds)
+                cache["normalize"] = False
+            cache["reducer"] = reducer
+            cache["sig"] = names
+            cache["proj"] = {u.name: p for u, p in zip(utterances, projections)}
+        elif added:
+            new = [u for u in utterances if u.name not in cache["proj"]]
+            new_embeds = np.asarray([u.embed for u in new], dtype=np.float32)
+            if cache["normalize"]:
+                from sklearn.preprocessing import normalize
+
+                new_embeds = normalize(new_embeds)
+            new_projections = cache["reducer"].transform(new_embeds)
+            cache["proj"].update(zip([u.name for u in new], new_projections))
+
+        return np.asarray([cache["proj"][u.name] for u in utterances])
 
     def save_audio_file(self, wav, sample_rate):
         dialog = QFileDialog()
@@ -146,27 +297,76 @@ class UI(QDialog):
             # Default format is wav
             if Path(fpath).suffix == "":
                 fpath += ".wav"
-            sf.write(fpath, wav, sample_rate)
+            # explicit subtype skips soundfile's dtype inference over the samples, but
+            # FLAC only supports PCM subtypes — let soundfile pick its default there
+            subtype = "FLOAT" if Path(fpath).suffix.lower() == ".wav" else None
+            sf.write(fpath, wav, sample_rate, subtype=subtype)
 
-    def setup_audio_devices(self, sample_rate):
-        input_devices = []
-        output_devices = []
-        for device in sd.query_devices():
-            # Check if valid input
+    _audio_device_cache_path = Path.home() / ".cache" / "memic" / "audio_devices.json"
+
+    def _load_audio_device_cache(self):
+        try:
+            return json.loads(self._audio_device_cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_audio_device_cache(self, cache):
+        try:
+            self._audio_device_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._audio_device_cache_path.write_text(json.dumps(cache))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _probe_audio_device(device, sample_rate):
+        """Check whether a device works as input/output — each check opens and closes a PortAudio stream."""
+        is_input = False
+        is_output = False
+        error = None
+        if device["max_input_channels"] > 0:
             try:
                 sd.check_input_settings(device=device["name"], samplerate=sample_rate)
-                input_devices.append(device["name"])
+                is_input = True
             except:
                 pass
-
-            # Check if valid output
+        if device["max_output_channels"] > 0:
             try:
                 sd.check_output_settings(device=device["name"], samplerate=sample_rate)
-                output_devices.append(device["name"])
+                is_output = True
             except Exception as e:
+                error = str(e)
+        return is_input, is_output, error
+
+    def setup_audio_devices(self, sample_rate):
+        # PortAudio open/close probes can take 10s-100s of ms per device, so skip devices
+        # whose advertised channel counts already preclude the role, remember verdicts
+        # across runs on disk (keyed by name/host API/sample rate), and probe the rest
+        # concurrently — each probe blocks on the driver, not the GIL
+        cache = self._load_audio_device_cache()
+        results = {}
+        to_probe = []
+        for device in sd.query_devices():
+            key = "%s|%s|%d" % (device["name"], device["hostapi"], sample_rate)
+            if key in cache:
+                results[device["name"]] = tuple(cache[key])
+            else:
+                to_probe.append((device, key))
+
+        if to_probe:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                probed = list(pool.map(lambda d: self._probe_audio_device(d, sample_rate), [d for d, _ in to_probe]))
+            for (device, key), (is_input, is_output, error) in zip(to_probe, probed):
+                results[device["name"]] = (is_input, is_output)
+                cache[key] = [is_input, is_output]
                 # Log a warning only if the device is not an input
-                if device["name"] not in input_devices:
-                    warn("Unsupported output device %s for the sample rate: %d \nError: %s" % (device["name"], sample_rate, str(e)))
+                if error is not None and not is_input:
+                    warn("Unsupported output device %s for the sample rate: %d \nError: %s" % (device["name"], sample_rate, error))
+            self._save_audio_device_cache(cache)
+
+        input_devices = [name for name, (is_input, _) in results.items() if is_input]
+        output_devices = [name for name, (_, is_output) in results.items() if is_output]
 
         if len(input_devices) == 0:
             self.log("No audio input device detected. Recording may not work.")
@@ -212,25 +412,57 @@ class UI(QDialog):
 
         self.log("Recording %d seconds of audio" % duration)
         sd.stop()
+
+        # record through a callback into a preallocated buffer: the progress bar tracks
+        # frames actually delivered by the driver (no drift against wall-clock) and the
+        # method returns the moment the last frame lands instead of sleeping out the duration
+        n_frames = int(duration * sample_rate)
+        buf = np.empty((n_frames, 1), np.float32)
+        written = 0
+        done = threading.Event()
+
+        def callback(indata, frames, time_info, status):
+            nonlocal written
+            take = min(frames, n_frames - written)
+            buf[written : written + take] = indata[:take]
+            written += take
+            if written >= n_frames:
+                done.set()
+                raise sd.CallbackStop
+
         try:
-            wav = sd.rec(duration * sample_rate, sample_rate, 1)
+            stream = sd.InputStream(samplerate=sample_rate, channels=1, dtype="float32", callback=callback)
+            stream.start()
         except Exception as e:
             print(e)
             self.log("Could not record anything. Is your recording device enabled?")
             self.log("Your device must be connected before you start the toolbox.")
+            self.record_button.setText("Record")
+            self.record_button.setDisabled(False)
             return None
 
-        for i in np.arange(0, duration, 0.1):
-            self.set_loading(i, duration)
-            sleep(0.1)
+        # if the stream aborts mid-capture (device unplugged, driver error) the
+        # callback stops firing and `done` never gets set — bound the wait with a
+        # deadline slightly past the requested duration instead of spinning forever
+        deadline = monotonic() + duration + 1.0
+        while not done.wait(0.05):
+            self.set_loading(written / sample_rate, duration)
+            if monotonic() > deadline:
+                stream.stop()
+                stream.close()
+                self.log("The recording stopped early. Is your recording device still connected?")
+                self.record_button.setText("Record")
+                self.record_button.setDisabled(False)
+                return None
         self.set_loading(duration, duration)
-        sd.wait()
+        stream.stop()
+        stream.close()
 
         self.log("Done recording.")
         self.record_button.setText("Record")
         self.record_button.setDisabled(False)
 
-        return wav.squeeze()
+        return buf.squeeze()
 
     @property
     def current_dataset_name(self):
@@ -255,11 +487,20 @@ class UI(QDialog):
         """
         box.blockSignals(True)
         box.clear()
-        for item in items:
-            item = list(item) if isinstance(item, tuple) else [item]
-            box.addItem(str(item[0]), *item[1:])
+        if not any(isinstance(item, tuple) for item in items):
+            # bulk insert is batched at the C++ layer — one model update for N items
+            box.addItems([str(item) for item in items])
+        else:
+            model = box.model()
+            model.insertRows(0, len(items))
+            for i, item in enumerate(items):
+                item = list(item) if isinstance(item, tuple) else [item]
+                index = model.index(i, 0)
+                model.setData(index, str(item[0]))
+                if len(item) > 1:
+                    model.setData(index, item[1], Qt.UserRole)
         if len(items) > 0:
-            box.setCurrentIndex(np.random.randint(len(items)) if random else 0)
+            box.setCurrentIndex(randrange(len(items)) if random else 0)
         box.setDisabled(len(items) == 0)
         box.blockSignals(False)
 
@@ -306,16 +547,16 @@ class UI(QDialog):
         # Select a random utterance
         if level <= 2:
             utterances_root = datasets_root.joinpath(self.current_dataset_name, self.current_speaker_name)
-            utterances = []
-            for extension in ["mp3", "flac", "wav", "m4a"]:
-                utterances.extend(Path(utterances_root).glob("**/*.%s" % extension))
-            utterances = [fpath.relative_to(utterances_root) for fpath in utterances]
+            # a single recursive walk filtered on suffix instead of one glob per extension
+            exts = {".mp3", ".flac", ".wav", ".m4a"}
+            utterances = [fpath.relative_to(utterances_root) for fpath in utterances_root.rglob("*") if fpath.suffix.lower() in exts]
             self.repopulate_box(self.utterance_box, utterances, random)
 
     def check_filename(self):
         username = self.user_name_input.text()
         if username == "user01" and not self.datasets_root.joinpath("user01").exists():
-            other = [d for d in self.datasets_root.iterdir() if d.is_dir() and all(f.suffix == ".wav" for f in d.iterdir())]
+            with os.scandir(self.datasets_root) as it:
+                other = [d for d in it if d.is_dir() and all(f.name.endswith(".wav") for f in os.scandir(d.path))]
             # sort by most recent modified time to least recent
             other.sort(key=lambda d: d.stat().st_mtime, reverse=True)
             if len(other) > 0:
@@ -323,13 +564,17 @@ class UI(QDialog):
                 self.user_name_input.setText(username)
                 self.user_name_input_changed()
 
+        # compiled once per call rather than once per directory entry; re.escape
+        # keeps usernames containing regex metacharacters from breaking the match
+        pat = re.compile(rf"{re.escape(username)}@rec(\d+)\.wav")
         if (
             self.datasets_root is not None
-            and re.match(rf"{username}@rec\d*", self.record_name_input.text())
+            and re.match(rf"{re.escape(username)}@rec\d*", self.record_name_input.text())
             and (self.datasets_root / username).exists()
         ):
-            print(list((self.datasets_root / username).iterdir()))
-            n = len([1 for d in (self.datasets_root / username).iterdir() if re.match(rf"{username}@rec\d*\.wav", d.name)]) + 1
+            with os.scandir(self.datasets_root / username) as it:
+                nums = [int(m.group(1)) for d in it if (m := pat.match(d.name))]
+            n = max(nums) + 1 if nums else 1
             if n < 10:
                 n = f"0{n}"
             self.record_name_input.setText(f"{username}@rec{n}")
@@ -351,20 +596,32 @@ class UI(QDialog):
         return self.vocoder_box.itemData(self.vocoder_box.currentIndex())
 
     def populate_models(self, models_dir: Path):
+        # one directory walk checking the three model files per subdirectory,
+        # instead of one glob pass over models_dir per model type
+        encoder_fpaths, synthesizer_fpaths, vocoder_fpaths = [], [], []
+        with os.scandir(models_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if not entry.is_dir():
+                    continue
+                subdir = Path(entry.path)
+                if (f := subdir / "encoder.pt").exists():
+                    encoder_fpaths.append(f)
+                if (f := subdir / "synthesizer.pt").exists():
+                    synthesizer_fpaths.append(f)
+                if (f := subdir / "vocoder.pt").exists():
+                    vocoder_fpaths.append(f)
+
         # Encoder
-        encoder_fpaths = list(models_dir.glob("*/encoder.pt"))
         if len(encoder_fpaths) == 0:
             raise Exception("No encoder models found in %s" % models_dir)
         self.repopulate_box(self.encoder_box, [(f.parent.name, f) for f in encoder_fpaths])
 
         # Synthesizer
-        synthesizer_fpaths = list(models_dir.glob("*/synthesizer.pt"))
         if len(synthesizer_fpaths) == 0:
             raise Exception("No synthesizer models found in %s" % models_dir)
         self.repopulate_box(self.synthesizer_box, [(f.parent.name, f) for f in synthesizer_fpaths])
 
         # Vocoder
-        vocoder_fpaths = list(models_dir.glob("*/vocoder.pt"))
         vocoder_items = [(f.parent.name, f) for f in vocoder_fpaths] + [("Griffin-Lim", None)]
         self.repopulate_box(self.vocoder_box, vocoder_items)
 
@@ -397,13 +654,21 @@ class UI(QDialog):
         log_text = "\n".join(self.logs)
 
         self.log_window.setText(log_text)
-        self.app.processEvents()
+        self._pump_events()
 
     def set_loading(self, value, maximum=1):
         self.loading_bar.setValue(int(value * 100))
         self.loading_bar.setMaximum(maximum * 100)
         self.loading_bar.setTextVisible(value != 0)
-        self.app.processEvents()
+        # always pump on completion so a finished bar is never left stale
+        self._pump_events(force=value == maximum)
+
+    def _pump_events(self, force=False):
+        """Run the Qt event loop at most ~30 Hz so tight log/progress loops stay model-bound."""
+        now = monotonic()
+        if force or now - self._last_pump > 0.033:
+            self.app.processEvents()
+            self._last_pump = now
 
     def populate_gen_options(self, seed, trim_silences):
         if seed is not None:
@@ -438,7 +703,12 @@ class UI(QDialog):
         self.vocode_button.setDisabled(True)
         self.replay_wav_button.setDisabled(True)
         self.export_wav_button.setDisabled(True)
-        [self.log("") for _ in range(self.max_log_lines)]
+        self._clear_logs()
+
+    def _clear_logs(self):
+        """Blank the log buffer and window in one shot rather than one log() call per line."""
+        self.logs = [""] * self.max_log_lines
+        self.log_window.clear()
 
     def __init__(self):
         ## Initialize the application
@@ -475,6 +745,15 @@ class UI(QDialog):
         fig.subplots_adjust(left=0.02, bottom=0.02, right=0.98, top=0.98)
         self.projections_layout.addWidget(FigureCanvas(fig))
         self.umap_hot = False
+        self._umap_cache = {"reducer": None, "sig": frozenset(), "proj": {}, "normalize": False}
+        self._spec_ims = {"current": None, "generated": None}
+        self._embed_ims = {"current": None, "generated": None}
+        self._embed_cbars = {"current": None, "generated": None}
+        self._last_pump = 0.0
+        self._umap_bg = None
+        self._umap_pool = QThreadPool()
+        self._umap_pool.setMaxThreadCount(1)
+        self._umap_gen = 0
         self.clear_button = QPushButton("Clear")
         self.projections_layout.addWidget(self.clear_button)
 
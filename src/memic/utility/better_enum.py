@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Hashable, Iterable, Iterator
 from typing import Any, Generic, Protocol, TypeVar, _ProtocolMeta
 
 T = TypeVar("T")
@@ -7,23 +7,40 @@ T = TypeVar("T")
 class _BetterEnumMeta(type):
     """Metaclass for BetterEnum which adds functionality on the BetterEnum class/subclass so it doesn't initialization."""
 
+    def __new__(mcs, name, bases, ns):
+        cls = super().__new__(mcs, name, bases, ns)
+        # precompute the name/value views once at class creation — every query used
+        # to rescan cls.__dict__ with startswith/isinstance filters, O(N) per access
+        cls._names = tuple(k for k, v in ns.items() if not k.startswith("_") and not isinstance(v, classmethod))
+        cls._values = tuple(ns[k] for k in cls._names)
+        cls._value_set = frozenset(v for v in cls._values if isinstance(v, Hashable))
+        cls._items = tuple(zip(cls._names, cls._values))
+        # reverse map for get_name; first definition wins on duplicate values, and
+        # unhashable values (e.g. the argv lists in Cmds) stay out of the dict
+        cls._value_to_name = {}
+        for k, v in cls._items:
+            if isinstance(v, Hashable) and v not in cls._value_to_name:
+                cls._value_to_name[v] = k
+        return cls
+
     def __iter__(cls) -> Iterator[T]:
         """Iterate over the values of the enum."""
-        for key, value in cls.__dict__.items():
-            if not key.startswith("_"):
-                yield value
+        return iter(cls._values)
 
     def __len__(cls):
         """Return the number of values in the enum."""
-        return len(cls.values())
+        return len(cls._names)
 
     def __contains__(cls, item):
         """Return whether the item is a value in the enum."""
-        return item in cls.values()
+        try:
+            return item in cls._value_set or item in cls._values
+        except TypeError:  # unhashable item — fall back to the linear scan
+            return item in cls._values
 
     def items(cls) -> list[tuple[str, Any]]:
         """Return a list of the items of the enum."""
-        return zip(cls.keys(), cls.values())
+        return list(cls._items)
 
     def keys(cls) -> list[str]:
         """Return a list of the keys of the enum."""
@@ -31,17 +48,20 @@ class _BetterEnumMeta(type):
 
     def names(cls) -> list[str]:
         """Return a list of the names of the enum."""
-        return [k for k in cls.__dict__ if not k.startswith("_")]
+        return list(cls._names)
 
     def values(cls) -> list[Any]:
         """Return a list of the values of the enum."""
-        return [v for k, v in cls.__dict__.items() if not k.startswith("_") and not isinstance(v, classmethod)]
+        return list(cls._values)
 
     def get_name(cls, value: Any) -> str | None:
         """Return the name of the enum value (or None if the value is not found)."""
-        for k, v in cls.__dict__.items():
-            if not k.startswith("_") and v == value:
-                return k
+        try:
+            return cls._value_to_name.get(value)
+        except TypeError:  # unhashable value — fall back to the linear scan
+            for k, v in cls._items:
+                if v == value:
+                    return k
 
     def __getitem__(cls, item: str | type) -> Any:
         """Allow accessing the enum values using indexing by name."""
@@ -55,7 +75,7 @@ class _BetterEnumMeta(type):
         repr_strs = []
         n_keys = 0
 
-        count = len(list(cls.items()))
+        count = len(cls._names)
 
         for key, value in cls.items():
             if max_lines is None or n_keys < max_lines:
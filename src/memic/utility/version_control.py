@@ -1,6 +1,115 @@
 """Tools for managing git from python."""
+import asyncio
+import functools
+import json
 import logging
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+try:
+    # optional fast path: libgit2 reads .git in-process, skipping a subprocess per query
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# warms git_summary in the background so constructing a VersionControl never blocks
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# minimal environment for the git subprocesses: the C locale keeps output stable for
+# parsing, and GIT_OPTIONAL_LOCKS=0 stops read-only commands from taking the index lock
+_MIN_ENV = {
+    "PATH": os.environ.get("PATH", ""),
+    "HOME": os.environ.get("HOME", ""),
+    "LC_ALL": "C",
+    "GIT_OPTIONAL_LOCKS": "0",
+}
+
+# machine format for `git show -s`: hash, parents, author, date, body on their own lines
+_SHOW_FORMAT = "--format=%H%n%P%n%an <%ae>%n%ad%n%B"
+
+# every _mtime_cached store, so _cache_clear can drop them all after a mutation
+_MTIME_CACHES = []
+
+
+def _stat_mtime(path: str) -> int:
+    """Return the mtime of a path in nanoseconds, or -1 when it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _mtime_cached(*paths):
+    """Cache a zero-arg classmethod until any of the given .git paths changes mtime.
+
+    While the watched paths are unchanged, repeat calls cost a few os.stat syscalls
+    instead of a subprocess spawn; a ref update touches an mtime and recomputes.
+    """
+
+    def decorator(func):
+        cache = {}
+        _MTIME_CACHES.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(cls):
+            key = tuple(_stat_mtime(p) for p in paths)
+            if cache.get("key") != key or "value" not in cache:
+                # recompute against the live repo — memoized command output may be stale
+                cls.call.cache_clear()
+                cache["value"] = func(cls)
+                cache["key"] = key
+            return cache["value"]
+
+        return wrapper
+
+    return decorator
+
+
+class _GitWorker:
+    """A long-lived `git cat-file --batch` process for reading objects.
+
+    One persistent pipe replaces a fork+exec of the git binary per commit query;
+    the worker restarts its process transparently if it has died.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0, close_fds=False, env=_MIN_ENV
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "_GitWorker":
+        """Return the shared worker, (re)starting its process if needed."""
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._proc.poll() is not None:
+                cls._instance = cls()
+            return cls._instance
+
+    def query(self, rev: str) -> tuple[str, bytes]:
+        """Resolve a revision to `(oid, raw object bytes)`, or `("", b"")` when missing."""
+        with self._lock:
+            self._proc.stdin.write(rev.encode() + b"\n")
+            self._proc.stdin.flush()
+            header = self._proc.stdout.readline().split()
+            if len(header) != 3:  # "<rev> missing"
+                return "", b""
+            size = int(header[2])
+            body = b""
+            while len(body) < size:
+                chunk = self._proc.stdout.read(size - len(body))
+                if not chunk:  # process died mid-object — report missing so callers fall back
+                    return "", b""
+                body += chunk
+            self._proc.stdout.read(1)  # trailing newline after the object payload
+            return header[0].decode(), body
 
 
 class VersionControl:
@@ -11,89 +120,229 @@ class VersionControl:
             logger = logging.getLogger(logger)
         self.log = logger
         self.log.info("initialized VersionControl")
-        # self.summary = self.git_summary()
+        # speculative: the subprocesses overlap with whatever the caller does next,
+        # so the first read of `summary` usually returns instantly
+        self._summary_future = _EXECUTOR.submit(self.git_summary)
+
+    @property
+    def summary(self) -> dict:
+        """The git summary, computed on a background thread since construction."""
+        return self._summary_future.result()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def call(*cmd) -> str:
+        """Run a command given as argv words, memoizing the output per unique command line.
+
+        No shell is involved, so arguments with spaces or shell metacharacters pass through
+        verbatim and each call costs one process instead of two. Repeat queries (git_summary
+        alone fans out to several) cost a dict lookup instead of a subprocess spawn; the
+        state-changing commands below invalidate via `_cache_clear`.
+        """
+        # close_fds=False keeps subprocess on the cheap posix_spawn path, DEVNULL stops
+        # git from ever waiting on a terminal, and the trimmed env speeds up git itself
+        return subprocess.check_output(cmd, stdin=subprocess.DEVNULL, close_fds=False, env=_MIN_ENV).decode()
+
+    _summary_cache_path = Path.home() / ".cache" / "memic" / "git_summary.json"
+
+    @classmethod
+    def _cache_clear(cls):
+        """Drop all memoized command output (called after anything that mutates git state)."""
+        cls.call.cache_clear()
+        cls._pygit2_repo.cache_clear()
+        cls._summary_cache_path.unlink(missing_ok=True)
+        for cache in _MTIME_CACHES:
+            cache.clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _pygit2_repo():
+        """Return the pygit2 repository for the working directory, or None when unavailable."""
+        if pygit2 is None:
+            return None
+        try:
+            return pygit2.Repository(".")
+        except Exception:
+            return None
 
     @staticmethod
-    def call(cmd, *args, **kwargs) -> str:
-        """Call a shell command."""
-        cmd += "".join([f" -{a}" for a in args])
-        cmd += "".join([f" --{k} {v}" for k, v in kwargs.items()])
-        return subprocess.check_output(cmd, shell=True).decode()
+    def _format_commit_date(ts: int, offset_minutes: int) -> str:
+        """Format a commit timestamp and UTC offset like git's default date."""
+        offset = timezone(timedelta(minutes=offset_minutes))
+        dt = datetime.fromtimestamp(ts, offset)
+        # git leaves the day-of-month unpadded ("Sep 3", not "Sep 03"); strftime's
+        # %d always zero-pads, so splice the day in directly
+        return dt.strftime(f"%a %b {dt.day} %H:%M:%S %Y %z")
 
     # ____________________ INFO _______________________________
     @classmethod
     def git_status(cls) -> str:
         """Get the git status."""
-        return cls.call("git status")
+        return cls.call("git", "status")
 
     @classmethod
     def git_remote(cls) -> str:
         """Git the remote branch."""
-        return cls.call("git config --get remote.origin.url").split("\n")[0]
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            try:
+                return repo.remotes["origin"].url
+            except KeyError:
+                pass
+        return cls.call("git", "config", "--get", "remote.origin.url").split("\n")[0]
+
+    @classmethod
+    def git_status_v2(cls) -> dict:
+        """Git the branch headers and changed-file entries from one porcelain-v2 status call.
+
+        Returns `{"headers": {...}, "files": {path: XY}}` where the headers carry
+        `branch.head`/`branch.upstream`/`branch.ab` and XY is the two-letter status code
+        (a single `?`/`!` for untracked/ignored paths).
+        """
+        out = cls.call("git", "status", "--porcelain=v2", "-z", "--branch")
+        headers, files = {}, {}
+        records = iter(out.split("\0"))
+        for rec in records:
+            if not rec:
+                continue
+            if rec.startswith("# "):
+                key, _, value = rec[2:].partition(" ")
+                headers[key] = value
+            elif rec[0] == "1":
+                fields = rec.split(" ", 8)
+                files[fields[8]] = fields[1]
+            elif rec[0] == "2":
+                fields = rec.split(" ", 9)
+                next(records)  # with -z the rename/copy origin path travels as its own record
+                files[fields[9]] = fields[1]
+            elif rec[0] == "u":
+                fields = rec.split(" ", 10)
+                files[fields[10]] = fields[1]
+            elif rec[0] in "?!":
+                files[rec[2:]] = rec[0]
+        return {"headers": headers, "files": files}
 
     @classmethod
     def git_branch(cls) -> str:
         """Git the active branch."""
-        return cls.call("git rev-parse --abbrev-ref HEAD").split("\n")[0]
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            return repo.head.shorthand
+        for row in cls._refs_snapshot():
+            if row["head"]:
+                return row["refname"][len("refs/heads/") :]
+        # detached HEAD — no branch row carries the marker
+        return cls.git_status_v2()["headers"]["branch.head"]
 
     @classmethod
+    @_mtime_cached(".git/HEAD", ".git/packed-refs", ".git/refs/heads")
     def git_commit(cls) -> str:
         """Git the active commit."""
-        return cls.call("git rev-parse --abbrev-ref HEAD")
+        for row in cls._refs_snapshot():
+            if row["head"]:
+                return row["commit"]
+        # detached HEAD — no branch row carries the marker
+        return cls.call("git", "rev-parse", "HEAD").strip()
 
     @classmethod
     def git_commit_time(cls) -> str:
         """Git the time of the active commit."""
-        return cls.call("git log -1 --format=%cd")
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            commit = repo[repo.head.target]
+            return cls._format_commit_date(commit.commit_time, commit.committer.offset) + "\n"
+        _, raw = _GitWorker.get().query("HEAD")
+        for line in raw.decode().split("\n\n", 1)[0].splitlines():
+            if line.startswith("committer "):
+                return cls._format_ident_date(line[len("committer ") :]) + "\n"
+        return ""
+
+    @classmethod
+    def _format_ident_date(cls, ident: str) -> str:
+        """Format the `<timestamp> <offset>` tail of a commit ident line like git's default date."""
+        ts, tz = ident.rsplit(" ", 2)[1:]
+        return cls._format_commit_date(int(ts), int(tz[:3]) * 60 + int(f"{tz[0]}{tz[3:]}"))
 
     @classmethod
     def git_diff_str(cls, *args) -> str:
         """Git the difference from the active commit."""
-        return cls.call("git diff HEAD", *args)
+        return cls.call("git", "diff", "HEAD", *args)
 
     @classmethod
+    @_mtime_cached(".git/packed-refs", ".git/refs/heads", ".git/refs/tags")
     def git_latest_tag(cls) -> str:
         """Git the latest tag."""
-        try:
-            if cls.call("git describe --tags --abbrev=0").strip() == "":
-                return ""
-            else:
-                return cls.call("git describe --tags `git rev-list --tags --max-count=1`").strip()
-        except subprocess.CalledProcessError:
-            return ""
+        # git_tags is newest-first on both the pygit2 and the subprocess path, so the
+        # first entry is the newest tag repo-wide with its bare name — unlike describe,
+        # which reports the nearest tag reachable from HEAD plus a -N-g<sha> suffix
+        tags = cls.git_tags()
+        return tags[0] if tags else ""
+
+    @classmethod
+    def git_diff_name_status_z(cls) -> dict:
+        """Git `{path: status}` versus HEAD from a NUL-delimited name-status diff.
+
+        NUL delimiters parse exactly even for paths containing tabs or newlines;
+        rename/copy records carry two paths and are keyed on the destination.
+        """
+        raw = cls.call("git", "diff", "HEAD", "--name-status", "-z")
+        fields = iter(raw.split("\0"))
+        files = {}
+        for status in fields:
+            if not status:
+                continue
+            fn = next(fields, None)
+            if fn is None:
+                break
+            if status[0] in "RC":  # rename/copy: source path, then destination path
+                fn = next(fields, fn)
+            files[fn] = status[0]
+        return files
 
     @classmethod
     def git_changed_files(cls) -> dict:
         """Git a dictionary of the files which have changed and their status."""
-        t = cls.git_diff_str("-name-status")
+        status = cls.git_status_v2()
         files = {}
-        for line in t.splitlines():
-            status, fn, *_ = line.split("\t")
-            files[fn] = status
+        for fn, xy in status["files"].items():
+            if xy in "?!":
+                continue  # untracked/ignored — not part of the diff against HEAD
+            files[fn] = xy[1] if xy[0] == "." else xy[0]
         return files
 
     @classmethod
     def git_diff(cls) -> dict:
         """Git a dictionary of the files which have changed and their status and diff."""
-        changed_files = cls.git_changed_files()
+        # the NUL-delimited listing diffs against HEAD exactly like the numstat below,
+        # so the two path sets always line up (the porcelain status used by
+        # git_changed_files keys renames and staged-vs-worktree states differently)
+        changed_files = cls.git_diff_name_status_z()
+        # one numstat call carries the added/deleted counts for every file at once,
+        # instead of one --stat subprocess per changed file; -z keeps rename records
+        # as separate NUL path fields rather than the combined "old => new" syntax,
+        # so renamed files key on the same destination path as the name-status above
+        stats = {}
+        fields = iter(cls.call("git", "diff", "HEAD", "--numstat", "-z").split("\0"))
+        for record in fields:
+            if not record:
+                continue
+            added, deleted, fn = record.split("\t", 2)
+            if not fn:  # rename/copy: source path, then destination path
+                next(fields, None)
+                fn = next(fields, "")
+            stats[fn] = (added, deleted)
+
         files = {}
         for fn, status in changed_files.items():
-            t = cls.call(f'git --no-pager diff HEAD --stat -- "{fn}"')
-            if t:
-                x = t.split("\n")[0].strip()
-                if x.endswith("bytes"):
-                    n = int(x.split(" ")[-2])
-                    s = x
-                else:
-                    x = t.split("\n")[0].split(" | ")[1]
-                    if " " in x:
-                        n, s = x.split(" ")
-                    else:
-                        n = t
-                        s = ""
+            added, deleted = stats.get(fn, ("0", "0"))
+            if added == "-":
+                # binary file — numstat emits "-\t-", fall back to a per-file stat query
+                t = cls.call("git", "--no-pager", "diff", "HEAD", "--stat", "--", fn)
+                s = t.split("\n")[0].strip()
+                n = int(s.split(" ")[-2]) if s.endswith("bytes") else 0
             else:
-                n = 0
-                s = ""
+                n = int(added) + int(deleted)
+                s = "+" * int(added) + "-" * int(deleted)
 
             files[fn] = {"status": status, "stat": s, "diff_length": n}
             # e.g.      {'status': 'M', 'stat': '+--', 'diff_length': 3}
@@ -102,21 +351,76 @@ class VersionControl:
     @classmethod
     def git_config(cls) -> dict:
         """Git the current config."""
-        config = cls.call("git config --list")
-        config_dict = {}
-        for line in config.splitlines():
-            k, v = line.split("=")
-            config_dict[k] = v
-        return config_dict
+        # -z separates records with NUL and key from value with one \n, so values
+        # containing "=" (URLs, credential helpers) parse correctly
+        raw = cls.call("git", "config", "--list", "-z")
+        return {k: v for k, _, v in (rec.partition("\n") for rec in raw.split("\0") if rec)}
 
     @classmethod
     def git_commit_info(cls) -> dict:
         """Git info about the active commit."""
-        return cls.interpret_commit_log(cls.call("git log HEAD -1"))
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            commit = repo[repo.head.target]
+            parents = [str(p) for p in commit.parent_ids]
+            return {
+                "commit": str(commit.id),
+                "merge": " ".join(p[:7] for p in parents) if len(parents) > 1 else False,
+                "author": f"{commit.author.name} <{commit.author.email}>",
+                "date": cls._format_commit_date(commit.author.time, commit.author.offset),
+                "message": commit.message.strip(),
+            }
+        # parse the raw commit object from the batch worker instead of `git log HEAD -1`
+        try:
+            oid, raw = _GitWorker.get().query("HEAD")
+        except OSError:
+            oid = ""
+        if not oid:
+            return cls._git_show_commit_info()
+        headers, _, message = raw.decode().partition("\n\n")
+        parents = []
+        author = date = ""
+        for line in headers.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "parent":
+                parents.append(value)
+            elif key == "author":
+                author = value.rsplit(" ", 2)[0]
+                date = cls._format_ident_date(value)
+        return {
+            "commit": oid,
+            "merge": " ".join(p[:7] for p in parents) if len(parents) > 1 else False,
+            "author": author,
+            "date": date,
+            "message": message.strip(),
+        }
 
     @classmethod
-    def interpret_commit_log(cls, commit_log: str) -> dict:
-        """Convert a commit log string into a dictionary of the data."""
+    def _git_show_commit_info(cls) -> dict:
+        """Git the active commit fields from one machine-format git show call.
+
+        The explicit --format makes the output parseable with a bounded split, with none of
+        the Merge:/indentation guesswork that parsing the human-readable log needs.
+        """
+        return cls._parse_show_output(cls.call("git", "show", "-s", _SHOW_FORMAT, "HEAD"))
+
+    @staticmethod
+    def _parse_show_output(out: str) -> dict:
+        """Parse the output of a `git show -s` call made with `_SHOW_FORMAT`."""
+        commit, parents, author, date, message = out.split("\n", 4)
+        parent_list = parents.split()
+        return {
+            "commit": commit,
+            "merge": " ".join(p[:7] for p in parent_list) if len(parent_list) > 1 else False,
+            "author": author,
+            "date": date,
+            "message": message.strip(),
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def interpret_commit_log(commit_log: str) -> dict:
+        """Convert a commit log string into a dictionary of the data (memoized — it is pure)."""
         lines = commit_log.splitlines()
         merge = 1 * lines[1].startswith("Merge: ")
         commit_info = {
@@ -131,25 +435,156 @@ class VersionControl:
     @classmethod
     def git_summary(cls) -> dict:
         """Git a dictionary summarizing the git state."""
-        remote = cls.git_remote()
-        branch = cls.git_branch()
-        info = cls.git_commit_info()
-        diff = cls.git_diff()
-        tag = cls.git_latest_tag()
-        summary = {"remote": remote, "branch": branch, "tag": tag, **info, "diff": diff}
+        # the five reads are independent subprocesses blocked on I/O — overlap them
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                "remote": pool.submit(cls.git_remote),
+                "branch": pool.submit(cls.git_branch),
+                "info": pool.submit(cls.git_commit_info),
+                "diff": pool.submit(cls.git_diff),
+                "tag": pool.submit(cls.git_latest_tag),
+            }
+            results = {k: f.result() for k, f in futures.items()}
+        summary = {"remote": results["remote"], "branch": results["branch"], "tag": results["tag"], **results["info"], "diff": results["diff"]}
+        return summary
+
+    @classmethod
+    def _git_state_key(cls) -> str:
+        """Build a cache key from the stat of the files that change with git state."""
+        parts = []
+        for p in (".git/HEAD", ".git/index", ".git/packed-refs", ".git/refs"):
+            try:
+                st = os.stat(p)
+                parts.append(f"{p}:{st.st_mtime_ns}:{st.st_size}")
+            except OSError:
+                parts.append(f"{p}:missing")
+        return "|".join(parts)
+
+    @classmethod
+    def git_summary_cached(cls) -> dict:
+        """Git the summary, served from an on-disk cache that outlives the process.
+
+        The cache is keyed on the mtimes of .git/HEAD, the index and the refs, so a fresh
+        process pays a few stat() calls and a JSON load instead of the full fan-out of
+        subprocess calls; any change to the repository state misses and recomputes.
+        """
+        key = cls._git_state_key()
+        try:
+            cached = json.loads(cls._summary_cache_path.read_text())
+            if cached.get("key") == key:
+                return cached["summary"]
+        except (OSError, ValueError):
+            pass
+        summary = cls.git_summary()
+        cls._summary_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cls._summary_cache_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"key": key, "summary": summary}))
+        os.replace(tmp, cls._summary_cache_path)  # atomic — readers never see a partial file
         return summary
 
+    # ____________________ ASYNC TWINS _______________________________
+    @staticmethod
+    async def _acall(*cmd) -> str:
+        """Async twin of `call` — run a command without blocking the event loop."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, env=_MIN_ENV
+        )
+        out, _ = await proc.communicate()
+        return out.decode()
+
+    @classmethod
+    async def git_remote_a(cls) -> str:
+        """Async twin of `git_remote`."""
+        return (await cls._acall("git", "config", "--get", "remote.origin.url")).split("\n")[0]
+
+    @classmethod
+    async def git_branch_a(cls) -> str:
+        """Async twin of `git_branch`."""
+        return (await cls._acall("git", "rev-parse", "--abbrev-ref", "HEAD")).strip()
+
+    @classmethod
+    async def git_commit_info_a(cls) -> dict:
+        """Async twin of `git_commit_info`."""
+        return cls._parse_show_output(await cls._acall("git", "show", "-s", _SHOW_FORMAT, "HEAD"))
+
+    @classmethod
+    async def git_latest_tag_a(cls) -> str:
+        """Async twin of `git_latest_tag`."""
+        return (await cls._acall("git", "for-each-ref", "--sort=-creatordate", "--count=1", "--format=%(refname:short)", "refs/tags/")).strip()
+
+    @classmethod
+    async def git_diff_a(cls) -> dict:
+        """Async twin of `git_diff` (thread off-load — it is a multi-command pipeline)."""
+        return await asyncio.to_thread(cls.git_diff)
+
+    @classmethod
+    async def git_summary_a(cls) -> dict:
+        """Async twin of `git_summary` — the five reads overlap on the event loop.
+
+        Usable from application-level asyncio (e.g. a web handler overlapping git
+        with other awaits), where the thread pool in `git_summary` cannot compose.
+        """
+        remote, branch, info, diff, tag = await asyncio.gather(
+            cls.git_remote_a(), cls.git_branch_a(), cls.git_commit_info_a(), cls.git_diff_a(), cls.git_latest_tag_a()
+        )
+        return {"remote": remote, "branch": branch, "tag": tag, **info, "diff": diff}
+
+    @classmethod
+    def _refs_snapshot(cls) -> list:
+        """Git one row per branch and tag, newest first, from a single for-each-ref call.
+
+        Each row is a dict with `head` (True on the checked-out branch), `type`, `refname`,
+        `commit` and `date`; every ref-derived query below filters this one snapshot, so the
+        underlying subprocess runs once per cache generation.
+        """
+        out = cls.call(
+            "git",
+            "for-each-ref",
+            "refs/heads/",
+            "refs/tags/",
+            "--sort=-creatordate",
+            "--format=%(HEAD)\t%(objecttype)\t%(refname)\t%(objectname)\t%(committerdate:iso)",
+        )
+        rows = []
+        for line in out.splitlines():
+            head, objecttype, refname, objectname, date = line.split("\t")
+            rows.append({"head": head == "*", "type": objecttype, "refname": refname, "commit": objectname, "date": date})
+        return rows
+
+    @classmethod
+    def _refs_by_kind(cls) -> dict:
+        """Git the branch and tag names, newest first, filtered out of the refs snapshot."""
+        refs = {"branches": [], "tags": []}
+        for row in cls._refs_snapshot():
+            if row["refname"].startswith("refs/heads/"):
+                refs["branches"].append(row["refname"][len("refs/heads/") :])
+            elif row["refname"].startswith("refs/tags/"):
+                refs["tags"].append(row["refname"][len("refs/tags/") :])
+        return refs
+
     @classmethod
+    @_mtime_cached(".git/packed-refs", ".git/refs/heads", ".git/refs/tags")
     def git_branches(cls):
         """Git a list of the branches."""
-        return cls.call("git for-each-ref --sort=-committerdate refs/heads/ --format='%(refname:short)'").splitlines()
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            heads = [(repo.branches[name].peel(pygit2.Commit).commit_time, name) for name in repo.branches.local]
+            return [name for _, name in sorted(heads, reverse=True)]
+        return cls._refs_by_kind()["branches"]
 
     @classmethod
+    @_mtime_cached(".git/packed-refs", ".git/refs/heads", ".git/refs/tags")
     def git_tags(cls):
         """Git a list of the tags."""
-        tag_lines = cls.call('git log --tags --simplify-by-decoration --pretty="format:%ai %d" | grep tag: ').splitlines()
-        tags = [line.split("tag: ")[1].split(",")[0].replace(")", "") for line in tag_lines]
-        return tags
+        repo = cls._pygit2_repo()
+        if repo is not None:
+            tags = []
+            for ref in repo.references:
+                if ref.startswith("refs/tags/"):
+                    commit = repo.references[ref].peel(pygit2.Commit)
+                    tags.append((commit.commit_time, ref[len("refs/tags/") :]))
+            return [name for _, name in sorted(tags, reverse=True)]
+        return cls._refs_by_kind()["tags"]
 
     @classmethod
     def git_options(cls):
@@ -160,17 +595,23 @@ class VersionControl:
     @classmethod
     def git_stash(cls):
         """Stash local changes."""
-        return cls.call("git stash")
+        out = cls.call("git", "stash")
+        cls._cache_clear()
+        return out
 
     @classmethod
     def git_set_username(cls, name, set_global=False):
         """Set the git username."""
-        return cls.call(f'git config {"--global "*set_global}user.name "{name}"')
+        out = cls.call("git", "config", *(("--global",) if set_global else ()), "user.name", name)
+        cls._cache_clear()
+        return out
 
     @classmethod
     def git_set_useremail(cls, email, set_global=False):
         """Set the git email."""
-        return cls.call(f'git config {"--global "*set_global}user.email {email}')
+        out = cls.call("git", "config", *(("--global",) if set_global else ()), "user.email", email)
+        cls._cache_clear()
+        return out
 
     @classmethod
     def git_set_user(cls, name, email, set_global=False):